@@ -1,27 +1,14 @@
 import streamlit as st
-import yfinance as yf
 import pandas as pd
-import matplotlib.pyplot as plt
 import base64
-from io import BytesIO
 import datetime
-
-# ==========================================================
-# Chart Theme: Dark Theme via Matplotlib
-# ==========================================================
-plt.style.use("dark_background")
-plt.rcParams.update({
-    "axes.facecolor": "#1e1e1e",
-    "figure.facecolor": "#1e1e1e",
-    "axes.edgecolor": "#444444",
-    "axes.labelcolor": "white",
-    "xtick.color": "white",
-    "ytick.color": "white",
-    "text.color": "white",
-    "grid.color": "#444444",
-    "grid.linestyle": "--",
-    "legend.edgecolor": "white"
-})
+import os
+import pickle
+import re
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
 
 # ==========================================================
 # Page Configuration (must be first st command)
@@ -57,211 +44,303 @@ ticker = st.text_input("Enter Ticker Symbol (e.g., MELI, AAPL, MO, NVDA)", value
 # ==========================================================
 # Data Loading & Utility Functions
 # ==========================================================
-@st.cache_data
-def get_data(ticker):
-    stock = yf.Ticker(ticker)
-    info = stock.info
-    bs = stock.balance_sheet if stock.balance_sheet is not None else pd.DataFrame()
-    fin = stock.financials if stock.financials is not None else pd.DataFrame()
+# Fetched data is also kept on disk, one file per endpoint, so app restarts
+# don't refetch. Annual statements change rarely; prices change daily.
+CACHE_DIR = Path(".cache")
+STATEMENT_TTL = 7 * 24 * 3600  # seconds
+PRICE_TTL = 24 * 3600  # seconds
+
+class PartialLoad(Exception):
+    """A usable but incomplete result, raised so st.cache_data won't store it."""
+    def __init__(self, result, errors):
+        super().__init__("; ".join(f"{name}: {err}" for name, err in errors.items()))
+        self.result = result
+        self.errors = errors
+
+def unwrap_partial(func, *args):
+    """Call `func`; return (result, errors), where errors is non-empty for a partial load."""
+    try:
+        return func(*args), {}
+    except PartialLoad as e:
+        return e.result, e.errors
+
+def disk_cached(ticker, name, fetch, ttl):
+    """Return `fetch()`, reusing a copy pickled under CACHE_DIR for up to `ttl` seconds."""
+    safe_ticker = re.sub(r"[^A-Za-z0-9.^-]", "_", ticker.upper())
+    # Prefix names starting with a dot so "." or ".." can't point outside CACHE_DIR.
+    if safe_ticker.startswith("."):
+        safe_ticker = "_" + safe_ticker
+    path = CACHE_DIR / safe_ticker / f"{name}.pkl"
+    # Cache problems must never fail the fetch itself, so every disk step is guarded.
+    try:
+        if path.exists() and time.time() - path.stat().st_mtime < ttl:
+            with open(path, "rb") as f:
+                return pickle.load(f)
+    except Exception:
+        pass  # Unreadable path or cache file; fall through and refetch.
+    value = fetch()
+    # Don't persist empty responses (bad ticker or Yahoo hiccup).
+    if value is not None and not getattr(value, "empty", False):
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            # Write to a temp file and rename, so concurrent readers never see a partial pickle.
+            fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    pickle.dump(value, f)
+                os.replace(tmp_path, path)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+        except Exception:
+            pass  # Read-only filesystem or unpicklable value; the in-memory cache still applies.
+    return value
+
+# One Ticker per symbol, shared across sessions. Ticker objects memoize what
+# they fetch, so expire them with analyze or statements would never refresh.
+@st.cache_resource(ttl=3600, show_spinner=False)
+def get_ticker(ticker):
+    # yfinance is imported here so the page renders before its import graph loads.
+    import yfinance as yf
+    # By default yfinance turns statement errors (e.g. rate limits) into empty
+    # frames; raise them instead so get_data reports the endpoint as failed.
+    if hasattr(yf, "config"):
+        yf.config.debug.hide_exceptions = False
+    return yf.Ticker(ticker)
+
+# Readable names for get_data's endpoints, used in load warnings.
+ENDPOINT_LABELS = {"shares": "share count", "bs": "balance sheet", "fin": "income statement", "close": "price history", "div": "dividend"}
+
+def get_data(ticker, period="10y"):
+    """Fetch a ticker's endpoints; returns (data, errors) with errors keyed by endpoint."""
+    # Not memoized here: analyze() caches the finished result, so one TTL applies.
+    stock = get_ticker(ticker)
+    # Each attribute is a separate request to Yahoo; fetch them concurrently.
+    with ThreadPoolExecutor(max_workers=5) as executor:
+        futures = {
+            # Only the share count is used; fast_info avoids the full quoteSummary payload.
+            "shares": executor.submit(disk_cached, ticker, "shares", lambda: stock.fast_info["shares"], PRICE_TTL),
+            "bs": executor.submit(disk_cached, ticker, "balance_sheet", lambda: stock.balance_sheet, STATEMENT_TTL),
+            "fin": executor.submit(disk_cached, ticker, "financials", lambda: stock.financials, STATEMENT_TTL),
+            # Restrict historical price data to 10 years by default.
+            "close": executor.submit(disk_cached, ticker, f"close_1mo_{period}", lambda: monthly_close(stock, period), PRICE_TTL),
+            "div": executor.submit(disk_cached, ticker, "dividends", lambda: stock.dividends, PRICE_TTL),
+        }
+        results, errors = {}, {}
+        for name, future in futures.items():
+            try:
+                results[name] = future.result()
+            except Exception as e:
+                # One failed endpoint shouldn't discard the others; treat it as missing.
+                results[name] = None
+                errors[name] = e
+    # Every metric needs the income statement; without it there is nothing to show.
+    if "fin" in errors:
+        raise errors["fin"]
+    # disk_cached never stores empty frames, so an empty statement came straight
+    # from Yahoo; older yfinance returns one instead of raising. Count it as failed.
+    for name in ("fin", "bs"):
+        if results[name] is not None and results[name].empty:
+            errors[name] = LookupError("Yahoo returned an empty statement")
+    shares = results["shares"]
+    bs = results["bs"] if results["bs"] is not None else pd.DataFrame()
+    fin = results["fin"] if results["fin"] is not None else pd.DataFrame()
     # We will calculate EPS manually; ignore stock.earnings as it's deprecated.
     earnings = pd.DataFrame()  
-    # Restrict historical price data to 10 years.
-    hist = stock.history(period="10y")
-    div = stock.dividends if stock.dividends is not None else pd.Series(dtype="float64")
-    return info, bs, fin, earnings, hist, div
+    close = results["close"] if results["close"] is not None else pd.Series(dtype="float64")
+    div = results["div"] if results["div"] is not None else pd.Series(dtype="float64")
+    return (shares, bs, fin, earnings, close, div), errors
+
+def monthly_close(stock, period):
+    # Only the chart uses prices; ask Yahoo for monthly bars instead of every daily one.
+    hist = stock.history(period=period, interval="1mo")
+    if "Close" not in hist:
+        return pd.Series(dtype="float64")
+    return hist["Close"]
 
 def safe_ratio(numerator, denominator):
-    try:
-        return numerator / denominator if denominator and denominator != 0 else None
-    except:
-        return None
+    # Element-wise division; zero denominators give NaN instead of inf.
+    return numerator / denominator.where(denominator != 0)
+
+def year_rows(df, labels, years):
+    """Return statement rows `labels` as columns of a frame indexed by fiscal year."""
+    if df.empty:
+        return pd.DataFrame(float("nan"), index=years, columns=labels)
+    # Labels the statement doesn't report come back as all-NaN rows.
+    rows = df.reindex(labels)
+    col_years = rows.columns.year
+    # Statements list the newest period first; keep the first column per year.
+    first = ~col_years.duplicated()
+    aligned = pd.DataFrame(rows.to_numpy()[:, first].T, index=col_years[first], columns=labels)
+    return aligned.reindex(years).astype("float64")
 
 def get_recent_years(df, max_years=10):
     if df.empty:
         return []
     try:
         years = sorted({col.year for col in df.columns})
-    except Exception:
+    except AttributeError:
+        # Columns aren't dates; the periods are on the index instead.
         years = sorted({idx.year for idx in df.index})
     return years[-max_years:]
 
-def format_percent(value):
-    if value is None:
-        return "Missing"
-    try:
-        return f"{value*100:.1f}%"
-    except:
-        return str(value)
+def evaluate_metric(metric_name, values, metric_data, threshold=None, comparison=">", is_percent=True):
+    """Store a metric's yearly values in `metric_data` and return its summary row."""
+    pv = values * 100 if is_percent else values
+    # Missing years stay NaN; the display layer renders them as "Missing".
+    metric_data[metric_name] = pv.round(2).to_dict()
+    # Missing years compare as False, so they never count as failures.
+    if threshold is None:
+        fails = 0
+    elif comparison == ">":
+        fails = int((pv < threshold * 100).sum())
+    else:
+        fails = int((pv > threshold * 100).sum())
+    pass_fail = "✅" if fails == 0 else "❌"
+    return (metric_name, pass_fail, f"{len(pv)-fails} / {len(pv)} years passed")
+
+@st.cache_data(show_spinner=False)
+def summary_csv(df_summary):
+    # Memoized on the table contents, so reruns reuse the encoded bytes.
+    return df_summary.to_csv(index=False).encode("utf-8")
+
+# ==========================================================
+# Checklist Evaluation
+# ==========================================================
+# Commentary text doesn't depend on the ticker.
+CPI = 0.032  # Example: 3.2% US CPI YoY
+PRICING_COMMENT = f"Compare the company's price increases to a US CPI of ~{CPI*100:.1f}%. [Source: U.S. Bureau of Labor Statistics] (EXAMPLE – Research on Your Own)"
+LABOR_COMMENT = "Review the company's SEC 10-K filings and recent news for union contracts, strike risks, and labor disputes. [Example Source: Reuters, 2023] (EXAMPLE – Research on Your Own)"
+BARRIERS_COMMENT = (
+    "- Strong brand loyalty and ecosystem integration [Source: Morningstar] (EXAMPLE – Research on Your Own)\n"
+    "- Patents and proprietary technology [Source: SEC 10-K] (EXAMPLE – Research on Your Own)\n"
+    "- Economies of scale and cost advantages [Source: HBR] (EXAMPLE – Research on Your Own)\n"
+    "- Well-established distribution channels [Source: WSJ] (EXAMPLE – Research on Your Own)"
+)
+
+def run_checklist(shares, bs, fin, div, fiscal_years):
+    """Evaluate every checklist item; returns (summary rows, metric_data)."""
+    summary = []  # List of (Metric, Pass/Fail, Value/Details)
+    metric_data = {}  # Dict: Metric Name -> {year: value}
+    # Group dividends by year once; RORC and the cut check both use it.
+    annual_div = div.groupby(div.index.year).sum() if not div.empty else pd.Series(dtype="float64")
+
+    # Pull every needed row in one pass per statement, aligned to the fiscal years.
+    raw = pd.concat([
+        year_rows(fin, ["Net Income", "Total Revenue", "Gross Profit"], fiscal_years),
+        year_rows(bs, ["Total Stockholder Equity", "Total Assets", "Long Term Debt"], fiscal_years),
+    ], axis=1)
+    net = raw["Net Income"]
+    # All ratios are whole-column divisions over the aligned frame.
+    # RORC approximation: Net Income ÷ (Net Income - Dividends)
+    ratios = pd.DataFrame({
+        "ROE": safe_ratio(net, raw["Total Stockholder Equity"]),
+        "ROA": safe_ratio(net, raw["Total Assets"]),
+        "Net Margin": safe_ratio(net, raw["Total Revenue"]),
+        "Gross Margin": safe_ratio(raw["Gross Profit"], raw["Total Revenue"]),
+        "RORC": safe_ratio(net, net - annual_div.reindex(fiscal_years, fill_value=0)),
+        "LT Debt": safe_ratio(raw["Long Term Debt"], net),
+    })
+
+    # ---- Metric 1: ROE ≥ 12% ----
+    summary.append(evaluate_metric("ROE ≥ 12%", ratios["ROE"], metric_data, threshold=0.12))
+
+    # ---- Metric 2: ROA ≥ 12% ----
+    summary.append(evaluate_metric("ROA ≥ 12%", ratios["ROA"], metric_data, threshold=0.12))
+
+    # ---- Metric 3: Historical EPS Per Share ----
+    # Calculate EPS manually as: Net Income / Shares Outstanding.
+    eps_vals = net / shares if shares else pd.Series(float("nan"), index=fiscal_years, dtype="float64")
+    metric_data["EPS Per Share"] = (eps_vals * 100).round(2).to_dict()
+    available_eps = int(eps_vals.notna().sum())
+    summary.append(("EPS Per Share", "—", f"{available_eps} / {len(fiscal_years)} years available"))
+
+    # ---- Metric 4: Net Margin ≥ 20% (Net Income ÷ Total Revenue) ----
+    summary.append(evaluate_metric("Net Margin ≥ 20%", ratios["Net Margin"], metric_data, threshold=0.20))
+
+    # ---- Metric 5: Gross Margin ≥ 40% (Gross Profit ÷ Total Revenue) ----
+    summary.append(evaluate_metric("Gross Margin ≥ 40%", ratios["Gross Margin"], metric_data, threshold=0.40))
+
+    # ---- Metric 6: Return on Retained Capital (RORC) ≥ 18% ----
+    summary.append(evaluate_metric("Return on Retained Capital ≥ 18%", ratios["RORC"], metric_data, threshold=0.18))
+
+    # ---- Metric 7: LT Debt ÷ Net Income < 5x (Latest Fiscal Year Only) ----
+    lt_ratio = ratios["LT Debt"].iloc[-1] if fiscal_years else None
+    if lt_ratio is None or pd.isna(lt_ratio):
+        summary.append(("LT Debt ÷ Net Income < 5x", "⚠️", "Missing"))
+    else:
+        summary.append(("LT Debt ÷ Net Income < 5x", "✅" if lt_ratio < 5 else "❌", f"{lt_ratio:.2f}x"))
+
+    # ---- Metric 8: Pricing Power vs. Inflation (Commentary) ----
+    summary.append(("Pricing Power vs. Inflation", "—", PRICING_COMMENT))
+
+    # ---- Metric 9: Organized Labor (Commentary) ----
+    summary.append(("Organized Labor", "—", LABOR_COMMENT))
+
+    # ---- Metric 11: Dividends & Buybacks (Commentary) ----
+    years_div = annual_div.index.tolist()
+    if not years_div:
+        div_comment = "No Dividends or Buybacks"
+        div_status = "—"
+    else:
+        # A cut is any year whose total payout is below the prior year's.
+        cuts = annual_div.index[annual_div.diff() < 0].tolist()
+        div_comment = f"{len(years_div)} years; Dividend cuts in: {cuts if cuts else 'None'} (EXAMPLE – Research on Your Own)"
+        div_status = "✅" if not cuts else "❌"
+    summary.append(("Dividends & Buybacks", div_status, div_comment))
+
+    # ---- Metric 12: Barriers to Entry (Commentary) ----
+    summary.append(("Barriers to Entry", "—", BARRIERS_COMMENT))
+
+    return summary, metric_data
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def analyze(ticker, period="10y"):
+    """Load a ticker and run the checklist; returns (close, fiscal_years, summary, metric_data)."""
+    # Cached per (ticker, period) so widget reruns don't hit Yahoo again.
+    (shares, bs, fin, earnings, close, div), errors = get_data(ticker, period)
+    fiscal_years = get_recent_years(fin, 10)
+    # Fallback: if fewer than 10 years are available, use the last 5.
+    if len(fiscal_years) < 10:
+        fiscal_years = get_recent_years(fin, 5)
+    summary, metric_data = run_checklist(shares, bs, fin, div, fiscal_years) if fiscal_years else ([], {})
+    result = close, fiscal_years, summary, metric_data
+    if errors:
+        # Any endpoint that raised or returned an empty statement lands here, so
+        # only complete loads are cached; the next rerun retries the rest.
+        raise PartialLoad(result, errors)
+    return result
+
+def show_disclaimer():
+    st.markdown("---")
+    st.markdown("<small>Disclaimer: This app is for informational purposes only. Data is sourced from Yahoo Finance and is dependent on data availability. SCM-Analytics does not guarantee the accuracy of the information and is not responsible for any investment decisions made based on this data.</small>", unsafe_allow_html=True)
 
 # ==========================================================
 # MAIN PROCESSING BLOCK
 # ==========================================================
 if ticker:
     try:
-        info, bs, fin, earnings, hist, div = get_data(ticker)
-        fiscal_years = get_recent_years(fin, 10)
-        # Fallback: if fewer than 10 years are available, use the last 5.
-        if len(fiscal_years) < 10:
-            fiscal_years = get_recent_years(fin, 5)
-        
+        # Fetching and scoring are cached per ticker; only rendering reruns.
+        (close, fiscal_years, summary, metric_data), load_errors = unwrap_partial(analyze, ticker)
+        for name, err in load_errors.items():
+            st.warning(f"Could not load {ENDPOINT_LABELS.get(name, name)} data for {ticker} ({err}); related metrics may be incomplete. Retrying on the next rerun.")
+
         # ----------------------------------------------------------
         # TOP SECTION: Stock Price Chart (Last 10 Years)
         # ----------------------------------------------------------
         st.subheader("📈 Stock Price (Last 10 Years)")
-        fig_price, ax_price = plt.subplots(figsize=(10, 3))
-        hist["Close"].resample("ME").last().plot(ax=ax_price, color="orange")
-        ax_price.set_title(f"{ticker} Monthly Closing Prices")
-        ax_price.set_xlabel("Date")
-        ax_price.set_ylabel("Price (USD)")
-        ax_price.grid(True)
-        st.pyplot(fig_price)
-
-        # ----------------------------------------------------------
-        # EVALUATION: Build Summary Table and Collect Yearly Data
-        # ----------------------------------------------------------
-        summary = []  # List of (Metric, Pass/Fail, Value/Details)
-        metric_data = {}  # Dict: Metric Name -> {year: value}
-
-        def evaluate_metric(metric_name, values_dict, threshold=None, comparison=">", is_percent=True):
-            fails = 0
-            data = {}
-            for y in fiscal_years:
-                v = values_dict.get(y)
-                if v is None:
-                    data[y] = "Missing"
-                else:
-                    pv = v * 100 if is_percent else v
-                    data[y] = round(pv, 2)
-                    if threshold is not None:
-                        if comparison == ">" and pv < threshold * 100:
-                            fails += 1
-                        elif comparison == "<" and pv > threshold * 100:
-                            fails += 1
-            metric_data[metric_name] = data
-            pass_fail = "✅" if fails == 0 else "❌"
-            summary.append((metric_name, pass_fail, f"{len(fiscal_years)-fails} / {len(fiscal_years)} years passed"))
-
-        # ---- Metric 1: ROE ≥ 12% ----
-        roe_vals = {}
-        for y in fiscal_years:
-            try:
-                net = fin.loc["Net Income", fin.columns[fin.columns.year == y]].values[0]
-                equity = bs.loc["Total Stockholder Equity", bs.columns[bs.columns.year == y]].values[0]
-                roe_vals[y] = safe_ratio(net, equity)
-            except:
-                roe_vals[y] = None
-        evaluate_metric("ROE ≥ 12%", roe_vals, threshold=0.12)
-
-        # ---- Metric 2: ROA ≥ 12% ----
-        roa_vals = {}
-        for y in fiscal_years:
-            try:
-                net = fin.loc["Net Income", fin.columns[fin.columns.year == y]].values[0]
-                assets = bs.loc["Total Assets", bs.columns[bs.columns.year == y]].values[0]
-                roa_vals[y] = safe_ratio(net, assets)
-            except:
-                roa_vals[y] = None
-        evaluate_metric("ROA ≥ 12%", roa_vals, threshold=0.12)
-
-        # ---- Metric 3: Historical EPS Per Share ----
-        # Calculate EPS manually as: Net Income / Shares Outstanding.
-        eps_vals = {}
-        shares = info.get("sharesOutstanding", None)
-        for y in fiscal_years:
-            try:
-                net = fin.loc["Net Income", fin.columns[fin.columns.year == y]].values[0]
-                if shares:
-                    eps_vals[y] = safe_ratio(net, shares)
-                else:
-                    eps_vals[y] = None
-            except:
-                eps_vals[y] = None
-        metric_data["EPS Per Share"] = {y: (round(v*100, 2) if v is not None else "Missing") for y, v in eps_vals.items()}
-        available_eps = sum(1 for v in eps_vals.values() if v is not None)
-        summary.append(("EPS Per Share", "—", f"{available_eps} / {len(fiscal_years)} years available"))
-
-        # ---- Metric 4: Net Margin ≥ 20% (Net Income ÷ Total Revenue) ----
-        net_margin_vals = {}
-        for y in fiscal_years:
-            try:
-                net = fin.loc["Net Income", fin.columns[fin.columns.year == y]].values[0]
-                rev = fin.loc["Total Revenue", fin.columns[fin.columns.year == y]].values[0]
-                net_margin_vals[y] = safe_ratio(net, rev)
-            except:
-                net_margin_vals[y] = None
-        evaluate_metric("Net Margin ≥ 20%", net_margin_vals, threshold=0.20)
-
-        # ---- Metric 5: Gross Margin ≥ 40% (Gross Profit ÷ Total Revenue) ----
-        gm_vals = {}
-        for y in fiscal_years:
-            try:
-                gross = fin.loc["Gross Profit", fin.columns[fin.columns.year == y]].values[0]
-                rev = fin.loc["Total Revenue", fin.columns[fin.columns.year == y]].values[0]
-                gm_vals[y] = safe_ratio(gross, rev)
-            except:
-                gm_vals[y] = None
-        evaluate_metric("Gross Margin ≥ 40%", gm_vals, threshold=0.40)
-
-        # ---- Metric 6: Return on Retained Capital (RORC) ≥ 18% ----
-        # Approximation: Net Income ÷ (Net Income - Dividends)
-        rorc_vals = {}
-        for y in fiscal_years:
-            try:
-                net = fin.loc["Net Income", fin.columns[fin.columns.year == y]].values[0]
-                year_divs = div[div.index.year == y].sum()
-                retained = net - year_divs
-                rorc_vals[y] = safe_ratio(net, retained)
-            except:
-                rorc_vals[y] = None
-        evaluate_metric("Return on Retained Capital ≥ 18%", rorc_vals, threshold=0.18)
-
-        # ---- Metric 7: LT Debt ÷ Net Income < 5x (Latest Fiscal Year Only) ----
-        try:
-            latest_y = fiscal_years[-1]
-            debt = bs.loc["Long Term Debt", bs.columns[bs.columns.year == latest_y]].values[0]
-            net_latest = fin.loc["Net Income", fin.columns[fin.columns.year == latest_y]].values[0]
-            lt_ratio = safe_ratio(debt, net_latest)
-            lt_comment = f"{lt_ratio:.2f}x" if lt_ratio is not None else "Missing"
-            summary.append(("LT Debt ÷ Net Income < 5x", "✅" if lt_ratio is not None and lt_ratio < 5 else "❌", lt_comment))
-        except:
-            summary.append(("LT Debt ÷ Net Income < 5x", "⚠️", "Missing"))
-
-        # ---- Metric 8: Pricing Power vs. Inflation (Commentary) ----
-        cpi = 0.032  # Example: 3.2% US CPI YoY
-        pricing_comment = f"Compare the company's price increases to a US CPI of ~{cpi*100:.1f}%. [Source: U.S. Bureau of Labor Statistics] (EXAMPLE – Research on Your Own)"
-        summary.append(("Pricing Power vs. Inflation", "—", pricing_comment))
-
-        # ---- Metric 9: Organized Labor (Commentary) ----
-        labor_comment = "Review the company's SEC 10-K filings and recent news for union contracts, strike risks, and labor disputes. [Example Source: Reuters, 2023] (EXAMPLE – Research on Your Own)"
-        summary.append(("Organized Labor", "—", labor_comment))
-
-        # ---- Metric 11: Dividends & Buybacks (Commentary) ----
-        years_div = sorted(set(div.index.year)) if not div.empty else []
-        if not years_div:
-            div_comment = "No Dividends or Buybacks"
-            div_status = "—"
+        if close.empty:
+            st.info(f"No price history available for {ticker}.")
         else:
-            cuts = []
-            for i in range(1, len(years_div)):
-                try:
-                    prev = div[div.index.year == years_div[i-1]].sum()
-                    curr = div[div.index.year == years_div[i]].sum()
-                    if curr < prev:
-                        cuts.append(years_div[i])
-                except:
-                    pass
-            div_comment = f"{len(years_div)} years; Dividend cuts in: {cuts if cuts else 'None'} (EXAMPLE – Research on Your Own)"
-            div_status = "✅" if not cuts else "❌"
-        summary.append(("Dividends & Buybacks", div_status, div_comment))
-
-        # ---- Metric 12: Barriers to Entry (Commentary) ----
-        barriers_comment = (
-            "- Strong brand loyalty and ecosystem integration [Source: Morningstar] (EXAMPLE – Research on Your Own)\n"
-            "- Patents and proprietary technology [Source: SEC 10-K] (EXAMPLE – Research on Your Own)\n"
-            "- Economies of scale and cost advantages [Source: HBR] (EXAMPLE – Research on Your Own)\n"
-            "- Well-established distribution channels [Source: WSJ] (EXAMPLE – Research on Your Own)"
-        )
-        summary.append(("Barriers to Entry", "—", barriers_comment))
+            st.caption(f"{ticker} Monthly Closing Prices")
+            st.line_chart(close, color="#FFA500", x_label="Date", y_label="Price (USD)")
+
+        # Without annual statements every metric would be empty; stop here.
+        # st.stop() raises a BaseException, so the handler below won't catch it.
+        if not fiscal_years:
+            st.warning(f"No annual financial statements available for {ticker}.")
+            show_disclaimer()
+            st.stop()
 
         # ======================================================
         # TOP SECTION: Display Summary Table
@@ -274,39 +353,29 @@ if ticker:
         # MIDDLE SECTION: Charts + Tables in Expanders & Tabs
         # ======================================================
         st.subheader("📊 Metrics (Year-by-Year Charts & Tables)")
-        for metric, data in metric_data.items():
+        # One numeric frame (rows=years, cols=metrics); missing years are NaN.
+        metric_frame = pd.DataFrame(metric_data, dtype="float64")
+        for metric in metric_frame.columns:
             with st.expander(f"{metric} Trend (Click to Expand)", expanded=False):
                 tab_chart, tab_table = st.tabs(["Chart", "Table"])
-                # Prepare DataFrame for the metric:
-                df_metric = pd.DataFrame.from_dict(data, orient="index", columns=["Value"])
-                df_metric.index = df_metric.index.map(lambda y: int(y))
-                df_metric["Value"] = df_metric["Value"].apply(lambda x: float(x) if isinstance(x, (int, float)) else None)
-                
-                # Create matplotlib chart:
-                fig, ax = plt.subplots(figsize=(8, 3))
-                ax.plot(df_metric.index, df_metric["Value"], marker="o", color="tab:blue")
-                ax.set_title(metric)
-                ax.set_xlabel("Fiscal Year")
-                ax.set_ylabel("Percentage")
-                ax.set_xticks(df_metric.index)
-                ax.grid(True, linestyle="--", linewidth=0.5)
-                st.pyplot(fig, clear_figure=True)
+                df_metric = metric_frame[[metric]].rename(columns={metric: "Value"})
+
+                # Chart is rendered client-side; string years keep the axis categorical.
+                tab_chart.line_chart(df_metric.rename(index=str), x_label="Fiscal Year", y_label="Percentage")
                 
-                # Display table:
-                df_display = df_metric.copy()
-                df_display["Value"] = df_display["Value"].apply(lambda x: f"{x:.2f}%" if isinstance(x, (int, float)) else "Missing")
-                tab_table.dataframe(df_display)
+                # Display table: ship the floats and let the Styler format them.
+                tab_table.dataframe(df_metric.style.format("{:.2f}%", na_rep="Missing"))
 
         # ======================================================
         # BOTTOM SECTION: Narrative Insights & Commentary
         # ======================================================
         st.subheader("🧠 Narrative Insights & Commentary")
         st.markdown("### 🏛️ Barriers to Entry")
-        st.markdown(barriers_comment)
+        st.markdown(BARRIERS_COMMENT)
         st.markdown("### 📉 Pricing Power vs. Inflation")
-        st.markdown(pricing_comment)
+        st.markdown(PRICING_COMMENT)
         st.markdown("### 🏭 Organized Labor")
-        st.markdown(labor_comment)
+        st.markdown(LABOR_COMMENT)
         st.markdown("### LT Debt ÷ Net Income")
         st.markdown("Refer to the Summary Table above for the latest LT Debt ÷ Net Income commentary.")
         st.markdown("### Dividends & Buybacks")
@@ -316,14 +385,13 @@ if ticker:
         # EXPORT SECTION: Download Summary as CSV
         # ======================================================
         st.subheader("📥 Export Results")
-        csv_data = df_summary.to_csv(index=False).encode("utf-8")
+        csv_data = summary_csv(df_summary)
         st.download_button("📤 Download Summary CSV", csv_data, file_name=f"{ticker}_summary.csv", mime="text/csv")
 
         # ======================================================
         # DISCLAIMER (Bottom of the Page)
         # ======================================================
-        st.markdown("---")
-        st.markdown("<small>Disclaimer: This app is for informational purposes only. Data is sourced from Yahoo Finance and is dependent on data availability. SCM-Analytics does not guarantee the accuracy of the information and is not responsible for any investment decisions made based on this data.</small>", unsafe_allow_html=True)
+        show_disclaimer()
 
     except Exception as e:
         st.error(f"Error processing ticker: {e}")